@@ -18,7 +18,7 @@ def get_footing_params(foundation_size: FoundationSize) -> FndParams:
     length = foundation_size.length
     shape = foundation_size.footing_shape
 
-    if not isclose(width, length) and shape != Shape.STRIP:
+    if not isclose(width, length) and shape is not Shape.STRIP:
         shape = Shape.RECTANGLE
 
     return width, length, shape
@@ -39,10 +39,8 @@ class AllowableBearingCapacity(ABC):
     @validators.le(25.4, exc_type=SettlementError)
     def tol_settlement(self, tol_settlement: float) -> None:
         self._tol_settlement = tol_settlement
-
-    def _sr(self) -> float:
-        """Calculate the settlement ratio."""
-        return self.tol_settlement / self.MAX_TOL_SETTLEMENT
+        # settlement ratio
+        self._sr = tol_settlement / self.MAX_TOL_SETTLEMENT
 
     def _fd(self) -> float:
         """Calculate the depth factor."""
@@ -70,6 +68,22 @@ class ABC_TYPE(enum.StrEnum):
     TERZAGHI = enum.auto()
 
 
+_ABC_CLASSES = {
+    ABC_TYPE.BOWLES: {
+        "pad": BowlesABC4PadFoundation,
+        "mat": BowlesABC4MatFoundation
+    },
+    ABC_TYPE.MEYERHOF: {
+        "pad": MeyerhofABC4PadFoundation,
+        "mat": MeyerhofABC4MatFoundation
+    },
+    ABC_TYPE.TERZAGHI: {
+        "pad": TerzaghiABC4PadFoundation,
+        "mat": TerzaghiABC4MatFoundation,
+    }
+}
+
+
 def create_allowable_bearing_capacity(corrected_spt_n_value: float,
                                       tol_settlement: float,
                                       depth: float,
@@ -124,34 +138,20 @@ def create_allowable_bearing_capacity(corrected_spt_n_value: float,
     if isinstance(abc_type, str):
         abc_type = ABC_TYPE(abc_type.casefold())
 
+    if abc_type not in _ABC_CLASSES:
+        raise ValueError(f"abc_type {abc_type} is not supported")
+
+    if foundation_type not in _ABC_CLASSES[abc_type]:
+        msg = "Unknown foundation type: {0}. Supported types: {1}"
+        supported_types = list(_ABC_CLASSES[abc_type].keys())
+        raise ValueError(msg.format(foundation_type, supported_types))
+
     fnd_size = create_foundation(depth=depth, width=width, length=length,
                                  eccentricity=eccentricity,
                                  ground_water_level=ground_water_level,
                                  shape=shape)
-    abc_classes = {
-        ABC_TYPE.BOWLES: {
-            "pad": BowlesABC4PadFoundation,
-            "mat": BowlesABC4MatFoundation
-        },
-        ABC_TYPE.MEYERHOF: {
-            "pad": MeyerhofABC4PadFoundation,
-            "mat": MeyerhofABC4MatFoundation
-        },
-        ABC_TYPE.TERZAGHI: {
-            "pad": TerzaghiABC4PadFoundation,
-            "mat": TerzaghiABC4MatFoundation,
-        }
-    }
-
-    if abc_type not in abc_classes:
-        raise ValueError(f"abc_type {abc_type} is not supported")
-
-    if foundation_type not in abc_classes[abc_type]:
-        msg = "Unknown foundation type: {1}. Supported types: {2}"
-        supported_types = list(abc_classes[abc_type].keys())
-        raise ValueError(msg.format(abc_type, supported_types))
 
-    abc_class = abc_classes[abc_type][foundation_type]
+    abc_class = _ABC_CLASSES[abc_type][foundation_type]
     abc = abc_class(corrected_spt_n_value=corrected_spt_n_value,
                     tol_settlement=tol_settlement, foundation_size=fnd_size)
 
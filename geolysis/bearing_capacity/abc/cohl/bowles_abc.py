@@ -42,14 +42,15 @@ class BowlesABC4PadFoundation(AllowableBearingCapacity):
 
             f_d &= 1 + 0.33 \cdot \frac{D_f}{B} \le 1.33
         """
-        n_corr = self.corrected_spt_n_value
         width = self.foundation_size.width
+        n_fd_sr = self.corrected_spt_n_value * self._fd() * self._sr
 
         if width <= 1.2:
-            return 19.16 * n_corr * self._fd() * self._sr()
+            return 19.16 * n_fd_sr
 
-        return (11.98 * n_corr * ((3.28 * width + 1) / (3.28 * width)) ** 2
-                * self._fd() * self._sr())
+        # (3.28B + 1) / 3.28B
+        ratio = 1.0 + 1.0 / (3.28 * width)
+        return 11.98 * ratio * ratio * n_fd_sr
 
 
 class BowlesABC4MatFoundation(BowlesABC4PadFoundation):
@@ -68,4 +69,4 @@ class BowlesABC4MatFoundation(BowlesABC4PadFoundation):
             f_d &= 1 + 0.33 \cdot \frac{D_f}{B} \le 1.33
         """
         n_corr = self.corrected_spt_n_value
-        return 11.98 * n_corr * self._fd() * self._sr()
+        return 11.98 * n_corr * self._fd() * self._sr
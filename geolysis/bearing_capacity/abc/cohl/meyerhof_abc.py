@@ -42,14 +42,15 @@ class MeyerhofABC4PadFoundation(AllowableBearingCapacity):
 
             f_d &= 1 + 0.33 \cdot \frac{D_f}{B} \le 1.33 
         """
-        n_corr = self.corrected_spt_n_value
         width = self.foundation_size.width
+        n_fd_sr = self.corrected_spt_n_value * self._fd() * self._sr
 
         if width <= 1.2:
-            return 12 * n_corr * self._fd() * self._sr()
+            return 12.0 * n_fd_sr
 
-        return (8 * n_corr * ((3.28 * width + 1) / (3.28 * width)) ** 2
-                * self._fd() * self._sr())
+        # (3.28B + 1) / 3.28B
+        ratio = 1.0 + 1.0 / (3.28 * width)
+        return 8.0 * ratio * ratio * n_fd_sr
 
 
 class MeyerhofABC4MatFoundation(MeyerhofABC4PadFoundation):
@@ -68,4 +69,4 @@ class MeyerhofABC4MatFoundation(MeyerhofABC4PadFoundation):
             f_d &= 1 + 0.33 \cdot \frac{D_f}{B} \le 1.33
         """
         n_corr = self.corrected_spt_n_value
-        return 8 * n_corr * self._fd() * self._sr()
+        return 8 * n_corr * self._fd() * self._sr
@@ -71,14 +71,16 @@ class TerzaghiABC4PadFoundation(AllowableBearingCapacity):
 
         .. math:: c_w = 2 - \frac{D_f}{2B} \le 2
         """
-        n_corr = self.corrected_spt_n_value
         width = self.foundation_size.width
+        n_cw_fd_sr = (self.corrected_spt_n_value * self._sr
+                      / (self._cw() * self._fd()))
 
         if width <= 1.2:
-            return 12 * n_corr * (1 / (self._cw() * self._fd())) * self._sr()
+            return 12.0 * n_cw_fd_sr
 
-        return (8 * n_corr * ((3.28 * width + 1) / (3.28 * width)) ** 2
-                * (1 / (self._cw() * self._fd())) * self._sr())
+        # (3.28B + 1) / 3.28B
+        ratio = 1.0 + 1.0 / (3.28 * width)
+        return 8.0 * ratio * ratio * n_cw_fd_sr
 
 
 class TerzaghiABC4MatFoundation(TerzaghiABC4PadFoundation):
@@ -105,4 +107,4 @@ class TerzaghiABC4MatFoundation(TerzaghiABC4PadFoundation):
         .. math:: c_w = 2 - \frac{D_f}{2B} \le 2
         """
         n_corr = self.corrected_spt_n_value
-        return 8 * n_corr * (1 / (self._cw() * self._fd())) * self._sr()
+        return 8.0 * n_corr * self._sr / (self._cw() * self._fd())
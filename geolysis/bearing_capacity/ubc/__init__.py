@@ -27,6 +27,18 @@ __all__ = ["UltimateBearingCapacity",
 
 
 class UltimateBearingCapacity(ABC):
+    # Shape, depth and inclination factors are neutral by default. Methods
+    # that account for them override these with properties.
+    s_c: float = 1.0
+    s_q: float = 1.0
+    s_gamma: float = 1.0
+    d_c: float = 1.0
+    d_q: float = 1.0
+    d_gamma: float = 1.0
+    i_c: float = 1.0
+    i_q: float = 1.0
+    i_gamma: float = 1.0
+
     def __init__(self, friction_angle: float,
                  cohesion: float,
                  moist_unit_wgt: float,
@@ -56,40 +68,47 @@ class UltimateBearingCapacity(ABC):
                                   defaults to False.
         :type apply_local_shear: bool, optional
         """
+        # apply_local_shear must be set first, friction_angle and cohesion
+        # depend on it.
+        self.apply_local_shear = apply_local_shear
         self.friction_angle = friction_angle
         self.cohesion = cohesion
         self.moist_unit_wgt = moist_unit_wgt
         self.load_angle = load_angle
         self.foundation_size = foundation_size
-        self.apply_local_shear = apply_local_shear
 
     @property
     def friction_angle(self) -> float:
         """Return friction angle for local shear in the case of local shear 
         failure or general shear in the case of general shear failure.
         """
-        if self.apply_local_shear:
-            return arctan((2 / 3) * tan(self._friction_angle))
-        return self._friction_angle
+        return self._shear_friction_angle
 
     @friction_angle.setter
     @validators.ge(0.0)
     def friction_angle(self, val: float):
         self._friction_angle = val
+        if self.apply_local_shear:
+            self._shear_friction_angle = arctan((2 / 3) * tan(val))
+        else:
+            self._shear_friction_angle = val
+        self._reset_cache()
 
     @property
     def cohesion(self) -> float:
         """Return cohesion for local shear in the case of local shear failure
         or general shear in the case of general shear failure.
         """
-        if self.apply_local_shear:
-            return (2 / 3) * self._cohesion
-        return self._cohesion
+        return self._shear_cohesion
 
     @cohesion.setter
     @validators.ge(0.0)
     def cohesion(self, val: float):
         self._cohesion = val
+        if self.apply_local_shear:
+            self._shear_cohesion = (2 / 3) * val
+        else:
+            self._shear_cohesion = val
 
     @property
     def moist_unit_wgt(self) -> float:
@@ -111,77 +130,61 @@ class UltimateBearingCapacity(ABC):
         self._load_angle = val
 
     @property
-    def s_c(self) -> float:
-        return 1.0
-
-    @property
-    def s_q(self) -> float:
-        return 1.0
-
-    @property
-    def s_gamma(self) -> float:
-        return 1.0
+    def apply_local_shear(self) -> bool:
+        return self._apply_local_shear
+
+    @apply_local_shear.setter
+    def apply_local_shear(self, val: bool):
+        self._apply_local_shear = val
+        # Re-derive the shear parameters if they have already been set.
+        if hasattr(self, "_friction_angle"):
+            self.friction_angle = self._friction_angle
+            self.cohesion = self._cohesion
+
+    def _water_corrections(self) -> tuple[float, float]:
+        """Return the ground water corrections of the surcharge and
+        embedment terms, in that order.
+        """
+        depth = self.foundation_size.depth
+        width = self.foundation_size.effective_width
+        water_level = self.foundation_size.ground_water_level
 
-    @property
-    def d_c(self) -> float:
-        return 1.0
+        if water_level == inf:
+            return 1.0, 1.0
 
-    @property
-    def d_q(self) -> float:
-        return 1.0
+        # a -> water level above the base of the foundation
+        a = max(depth - water_level, 0.0)
+        water_corr_q = min(1.0 - 0.5 * a / depth, 1.0)
 
-    @property
-    def d_gamma(self) -> float:
-        return 1.0
+        # b -> water level below the base of the foundation
+        b = max(water_level - depth, 0.0)
+        water_corr_gamma = min(0.5 + 0.5 * b / width, 1.0)
 
-    @property
-    def i_c(self) -> float:
-        return 1.0
+        return water_corr_q, water_corr_gamma
 
-    @property
-    def i_q(self) -> float:
-        return 1.0
-
-    @property
-    def i_gamma(self) -> float:
-        return 1.0
+    def _reset_cache(self) -> None:
+        """Discard bearing capacity factors cached on the instance, since
+        they depend on the friction angle.
+        """
+        for attr in ("n_c", "n_q", "n_gamma"):
+            self.__dict__.pop(attr, None)
 
     def bearing_capacity(self):
+        water_corr_q, water_corr_gamma = self._water_corrections()
         return (self._cohesion_term(1.0)
-                + self._surcharge_term()
-                + self._embedment_term(0.5))
+                + self._surcharge_term(water_corr_q)
+                + self._embedment_term(0.5, water_corr_gamma))
 
     def _cohesion_term(self, coef: float = 1.0) -> float:
         return coef * self.cohesion * self.n_c * self.s_c * self.d_c * self.i_c
 
-    def _surcharge_term(self) -> float:
-        depth = self.foundation_size.depth
-        water_level = self.foundation_size.ground_water_level
-
-        if water_level == inf:
-            water_corr = 1.0  # water correction
-        else:
-            # water level above the base of the foundation
-            a = max(depth - water_level, 0.0)
-            water_corr = min(1 - 0.5 * a / depth, 1)
-
+    def _surcharge_term(self, water_corr: float) -> float:
         # effective overburden pressure (surcharge)
-        eop = self.moist_unit_wgt * depth
+        eop = self.moist_unit_wgt * self.foundation_size.depth
         return eop * self.n_q * self.s_q * self.d_q * self.i_q * water_corr
 
-    def _embedment_term(self, coef: float = 0.5) -> float:
-        depth = self.foundation_size.depth
+    def _embedment_term(self, coef: float, water_corr: float) -> float:
         width = self.foundation_size.effective_width
-        water_level = self.foundation_size.ground_water_level
-
-        if water_level == inf:
-            # water correction
-            water_corr = 1.0
-        else:
-            #: b -> water level below the base of the foundation
-            b = max(water_level - depth, 0)
-            water_corr = min(0.5 + 0.5 * b / width, 1)
-
         return (coef * self.moist_unit_wgt * width * self.n_gamma
                 * self.s_gamma * self.d_gamma * self.i_gamma * water_corr)
 
@@ -220,6 +223,16 @@ class UBC_TYPE(enum.StrEnum):
     VESIC = enum.auto()
 
 
+_UBC_CLASSES = {
+    UBC_TYPE.HANSEN: HansenUltimateBearingCapacity,
+    UBC_TYPE.TERZAGHI: {Shape.STRIP: TerzaghiUBC4StripFooting,
+                        Shape.CIRCLE: TerzaghiUBC4CircularFooting,
+                        Shape.SQUARE: TerzaghiUBC4SquareFooting,
+                        Shape.RECTANGLE: TerzaghiUBC4RectangularFooting},
+    UBC_TYPE.VESIC: VesicUltimateBearingCapacity,
+}
+
+
 def create_ultimate_bearing_capacity(friction_angle: float,
                                      cohesion: float,
                                      moist_unit_wgt: float,
@@ -285,27 +298,18 @@ def create_ultimate_bearing_capacity(friction_angle: float,
     if isinstance(ubc_type, str):
         ubc_type = UBC_TYPE(ubc_type.casefold())
 
+    if ubc_type not in _UBC_CLASSES:
+        raise ValueError(f"ubc_type {ubc_type} is not supported")
+
     fnd_size = create_foundation(depth=depth, width=width, length=length,
                                  eccentricity=eccentricity,
                                  ground_water_level=ground_water_level,
                                  shape=shape)
 
-    ubc_classes = {
-        UBC_TYPE.HANSEN: HansenUltimateBearingCapacity,
-        UBC_TYPE.TERZAGHI: {Shape.STRIP: TerzaghiUBC4StripFooting,
-                            Shape.CIRCLE: TerzaghiUBC4CircularFooting,
-                            Shape.SQUARE: TerzaghiUBC4SquareFooting,
-                            Shape.RECTANGLE: TerzaghiUBC4RectangularFooting},
-        UBC_TYPE.VESIC: VesicUltimateBearingCapacity,
-    }
-
-    if ubc_type not in ubc_classes:
-        raise ValueError(f"ubc_type {ubc_type} is not supported")
-
-    if ubc_type == UBC_TYPE.TERZAGHI:
-        ubc_class = ubc_classes[ubc_type][fnd_size.footing_shape]
+    if ubc_type is UBC_TYPE.TERZAGHI:
+        ubc_class = _UBC_CLASSES[ubc_type][fnd_size.footing_shape]
     else:
-        ubc_class = ubc_classes[ubc_type]
+        ubc_class = _UBC_CLASSES[ubc_type]
 
     ubc = ubc_class(friction_angle=friction_angle,
                     cohesion=cohesion,
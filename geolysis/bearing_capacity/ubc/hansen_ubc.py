@@ -1,3 +1,5 @@
+import functools
+
 from geolysis.bearing_capacity import get_footing_params
 from geolysis.bearing_capacity.ubc import UltimateBearingCapacity
 from geolysis.foundation import FoundationSize, Shape
@@ -17,7 +19,6 @@ class HansenBearingCapacityFactor:
     """
 
     @classmethod
-    @round_
     def n_c(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_c`.
 
@@ -26,12 +27,9 @@ class HansenBearingCapacityFactor:
 
         .. math:: N_c = \cot(\phi) \left(N_q - 1\right)
         """
-        if isclose(friction_angle, 0.0):
-            return 5.14
-        return cot(friction_angle) * (cls.n_q(friction_angle) - 1.0)
+        return cls._n_c(friction_angle)
 
     @classmethod
-    @round_
     def n_q(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_q`.
 
@@ -43,11 +41,9 @@ class HansenBearingCapacityFactor:
             N_q = \tan^2\left(45 + \frac{\phi}{2}\right) \cdot
                   e^{\pi \tan(\phi)}
         """
-        return (tan(45.0 + friction_angle / 2.0) ** 2.0
-                * exp(pi * tan(friction_angle)))
+        return cls._n_q(friction_angle)
 
     @classmethod
-    @round_
     def n_gamma(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_{\gamma}`.
 
@@ -56,7 +52,56 @@ class HansenBearingCapacityFactor:
 
         .. math:: N_{\gamma} = 1.8 \left(N_q - 1\right) \tan(\phi)
         """
-        return 1.8 * (cls.n_q(friction_angle) - 1.0) * tan(friction_angle)
+        return cls._n_gamma(friction_angle)
+
+    # The factors are pure functions of the friction angle, so the unrounded
+    # values are memoized. Only the bearing capacity itself is rounded.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _n_c(friction_angle: float) -> float:
+        if isclose(friction_angle, 0.0):
+            return 5.14
+        n_q = HansenBearingCapacityFactor._n_q(friction_angle)
+        return cot(friction_angle) * (n_q - 1.0)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _n_q(friction_angle: float) -> float:
+        tan_ = tan(45.0 + friction_angle / 2.0)
+        return tan_ * tan_ * exp(pi * tan(friction_angle))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _n_gamma(friction_angle: float) -> float:
+        n_q = HansenBearingCapacityFactor._n_q(friction_angle)
+        return 1.8 * (n_q - 1.0) * tan(friction_angle)
+
+
+#: Hansen shape factors for each footing shape, as functions of the footing
+#: width to length ratio.
+_S_C = {Shape.STRIP: lambda r: 1.0,
+        Shape.RECTANGLE: lambda r: 1.0 + 0.2 * r,
+        Shape.SQUARE: lambda r: 1.3,
+        Shape.CIRCLE: lambda r: 1.3}
+
+_S_Q = {Shape.STRIP: lambda r: 1.0,
+        Shape.RECTANGLE: lambda r: 1.0 + 0.2 * r,
+        Shape.SQUARE: lambda r: 1.2,
+        Shape.CIRCLE: lambda r: 1.2}
+
+_S_GAMMA = {Shape.STRIP: lambda r: 1.0,
+            Shape.RECTANGLE: lambda r: 1.0 - 0.4 * r,
+            Shape.SQUARE: lambda r: 0.8,
+            Shape.CIRCLE: lambda r: 0.6}
+
+
+def _shape_factor(table: dict, foundation_size: FoundationSize) -> float:
+    width, length, shape = get_footing_params(foundation_size)
+    try:
+        return table[shape](width / length)
+    except KeyError:
+        raise ValueError("Invalid footing shape.") from None
 
 
 class HansenShapeFactor:
@@ -65,7 +110,6 @@ class HansenShapeFactor:
     """
 
     @classmethod
-    @round_
     def s_c(cls, foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_c`.
         
@@ -76,28 +120,16 @@ class HansenShapeFactor:
 
         .. math::
 
-            s_c &= 1.o \rightarrow \text{Strip footing}
+            s_c &= 1.0 \rightarrow \text{Strip footing}
 
             s_c &= 1.0 + 0.2 \frac{B}{L} \rightarrow \text{Rectangular footing}
 
             s_c &= 1.3 \rightarrow \text{Square or circular footing}
 
         """
-        width, length, shape = get_footing_params(foundation_size)
-
-        if shape == Shape.STRIP:
-            shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
-            shape_factor = 1.0 + 0.2 * width / length
-        elif shape in (Shape.SQUARE, Shape.CIRCLE):
-            shape_factor = 1.3
-        else:
-            raise ValueError("Invalid footing shape.")
-
-        return shape_factor
+        return _shape_factor(_S_C, foundation_size)
 
     @classmethod
-    @round_
     def s_q(cls, foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_q`. 
 
@@ -114,21 +146,9 @@ class HansenShapeFactor:
 
             s_q &= 1.2 \rightarrow \text{Square or circular footing}
         """
-        width, length, shape = get_footing_params(foundation_size)
-
-        if shape == Shape.STRIP:
-            shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
-            shape_factor = 1.0 + 0.2 * width / length
-        elif shape in (Shape.SQUARE, Shape.CIRCLE):
-            shape_factor = 1.2
-        else:
-            raise ValueError("Invalid footing shape.")
-
-        return shape_factor
+        return _shape_factor(_S_Q, foundation_size)
 
     @classmethod
-    @round_
     def s_gamma(cls, foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_{\gamma}`.
         
@@ -148,20 +168,7 @@ class HansenShapeFactor:
 
             s_{\gamma} &= 0.6 \rightarrow \text{Circular footing} 
         """
-        width, length, shape = get_footing_params(foundation_size)
-
-        if shape == Shape.STRIP:
-            shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
-            shape_factor = 1.0 - 0.4 * width / length
-        elif shape == Shape.SQUARE:
-            shape_factor = 0.8
-        elif shape == Shape.CIRCLE:
-            shape_factor = 0.6
-        else:
-            raise ValueError("Invalid footing shape.")
-
-        return shape_factor
+        return _shape_factor(_S_GAMMA, foundation_size)
 
 
 class HansenDepthFactor:
@@ -170,7 +177,6 @@ class HansenDepthFactor:
     """
 
     @classmethod
-    @round_
     def d_c(cls, foundation_size: FoundationSize) -> float:
         r"""Depth factor :math:`D_c`.
         
@@ -187,7 +193,6 @@ class HansenDepthFactor:
         return 1.0 + 0.35 * depth / width
 
     @classmethod
-    @round_
     def d_q(cls, foundation_size: FoundationSize) -> float:
         r"""Depth factor :math:`D_q`.
 
@@ -201,7 +206,6 @@ class HansenDepthFactor:
         return cls.d_c(foundation_size)
 
     @classmethod
-    @round_
     def d_gamma(cls) -> float:
         r"""Depth factor :math:`D_{\gamma}`.
         
@@ -218,7 +222,6 @@ class HansenInclinationFactor:
     """
 
     @classmethod
-    @round_
     def i_c(cls, cohesion: float, load_angle: float,
             foundation_size: FoundationSize) -> float:
         r"""Inclination factor :math:`I_c`.
@@ -243,7 +246,6 @@ class HansenInclinationFactor:
         return 1.0 - sin(load_angle) / (2.0 * cohesion * width * length)
 
     @classmethod
-    @round_
     def i_q(cls, load_angle: float) -> float:
         r"""Inclination factor :math:`I_q`.
 
@@ -258,7 +260,6 @@ class HansenInclinationFactor:
         return 1.0 - (1.5 * sin(load_angle)) / cos(load_angle)
 
     @classmethod
-    @round_
     def i_gamma(cls, load_angle: float) -> float:
         r"""Inclination factor :math:`I_{\gamma}`.
 
@@ -270,23 +271,24 @@ class HansenInclinationFactor:
 
             I_{\gamma} = I_q^2
         """
-        return cls.i_q(load_angle) ** 2.0
+        i_q = cls.i_q(load_angle)
+        return i_q * i_q
 
 
 class HansenUltimateBearingCapacity(UltimateBearingCapacity):
     """Ultimate bearing capacity for soils according to ``Hansen (1961)``."""
 
-    @property
+    @functools.cached_property
     def n_c(self) -> float:
-        return HansenBearingCapacityFactor.n_c(self.friction_angle)
+        return HansenBearingCapacityFactor._n_c(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_q(self) -> float:
-        return HansenBearingCapacityFactor.n_q(self.friction_angle)
+        return HansenBearingCapacityFactor._n_q(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_gamma(self) -> float:
-        return HansenBearingCapacityFactor.n_gamma(self.friction_angle)
+        return HansenBearingCapacityFactor._n_gamma(self.friction_angle)
 
     @property
     def s_c(self) -> float:
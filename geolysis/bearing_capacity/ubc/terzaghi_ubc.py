@@ -1,7 +1,8 @@
+import functools
 from abc import ABC
 
 from geolysis.bearing_capacity.ubc import UltimateBearingCapacity
-from geolysis.utils import cos, cot, deg2rad, exp, isclose, pi, round_, tan
+from geolysis.utils import cos, deg2rad, exp, pi, round_, tan
 
 __all__ = ["TerzaghiBearingCapacityFactor",
            "TerzaghiUBC4StripFooting",
@@ -9,6 +10,8 @@ __all__ = ["TerzaghiBearingCapacityFactor",
            "TerzaghiUBC4SquareFooting",
            "TerzaghiUBC4RectangularFooting"]
 
+_3PI_OVER_2 = 1.5 * pi
+
 
 class TerzaghiBearingCapacityFactor:
     """ Bearing capacity factors for ultimate bearing capacity according to
@@ -16,7 +19,6 @@ class TerzaghiBearingCapacityFactor:
     """
 
     @classmethod
-    @round_
     def n_c(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_c`.
 
@@ -25,12 +27,9 @@ class TerzaghiBearingCapacityFactor:
 
         .. math:: N_c = \cot(\phi) \cdot (N_q - 1)
         """
-        if isclose(friction_angle, 0.0):
-            return 5.7
-        return cot(friction_angle) * (cls.n_q(friction_angle) - 1.0)
+        return cls._n_c(friction_angle)
 
     @classmethod
-    @round_
     def n_q(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_q`.
 
@@ -42,12 +41,9 @@ class TerzaghiBearingCapacityFactor:
             N_q = \dfrac{e^{(\frac{3\pi}{2} - \phi)\tan\phi}}
                   {2\cos^2(45 + \frac{\phi}{2})}
         """
-        return (exp((3 * pi / 2 - deg2rad(friction_angle))
-                    * tan(friction_angle))
-                / (2 * (cos(45 + friction_angle / 2)) ** 2))
+        return cls._n_q(friction_angle)
 
     @classmethod
-    @round_
     def n_gamma(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_{\gamma}`.
         
@@ -56,88 +52,120 @@ class TerzaghiBearingCapacityFactor:
 
         .. math:: N_{\gamma} =  (N_q - 1) \cdot \tan(1.4\phi)
         """
-        return (cls.n_q(friction_angle) - 1.0) * tan(1.4 * friction_angle)
+        return cls._n_gamma(friction_angle)
+
+    @classmethod
+    def factors(cls, friction_angle: float) -> tuple[float, float, float]:
+        r"""Bearing capacity factors :math:`N_c`, :math:`N_q` and
+        :math:`N_{\gamma}`, in that order.
+
+        :param friction_angle: Angle of internal friction of the soil (degrees).
+        :type friction_angle: float
+        """
+        return cls._raw_factors(friction_angle)
+
+    # The factors are pure functions of the friction angle and share most of
+    # their terms, so they are computed together, unrounded, and memoized.
+    # Only the bearing capacity itself is rounded.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _raw_factors(friction_angle: float) -> tuple[float, float, float]:
+        tan_phi = tan(friction_angle)
+        cos_ = cos(45.0 + 0.5 * friction_angle)
+        n_q = (exp((_3PI_OVER_2 - deg2rad(friction_angle)) * tan_phi)
+               / (2.0 * cos_ * cos_))
+        if friction_angle == 0.0:
+            n_c = 5.7
+        else:
+            n_c = (n_q - 1.0) / tan_phi
+        n_gamma = (n_q - 1.0) * tan(1.4 * friction_angle)
+        return n_c, n_q, n_gamma
+
+    @staticmethod
+    def _n_c(friction_angle: float) -> float:
+        return TerzaghiBearingCapacityFactor._raw_factors(friction_angle)[0]
+
+    @staticmethod
+    def _n_q(friction_angle: float) -> float:
+        return TerzaghiBearingCapacityFactor._raw_factors(friction_angle)[1]
+
+    @staticmethod
+    def _n_gamma(friction_angle: float) -> float:
+        return TerzaghiBearingCapacityFactor._raw_factors(friction_angle)[2]
 
 
 class TerzaghiUltimateBearingCapacity(UltimateBearingCapacity, ABC):
+    #: Coefficients of the cohesion and embedment terms for the footing
+    #: shape, in that order.
+    _coefs: tuple[float, float]
 
-    @property
+    @functools.cached_property
     def n_c(self) -> float:
-        return TerzaghiBearingCapacityFactor.n_c(self.friction_angle)
+        return TerzaghiBearingCapacityFactor._n_c(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_q(self) -> float:
-        return TerzaghiBearingCapacityFactor.n_q(self.friction_angle)
+        return TerzaghiBearingCapacityFactor._n_q(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_gamma(self) -> float:
-        return TerzaghiBearingCapacityFactor.n_gamma(self.friction_angle)
+        return TerzaghiBearingCapacityFactor._n_gamma(self.friction_angle)
+
+    @round_
+    def bearing_capacity(self) -> float:
+        """Calculates ultimate bearing capacity for the footing."""
+        coh_coef, emb_coef = self._coefs
+        water_corr_q, water_corr_gamma = self._water_corrections()
+        return (self._cohesion_term(coh_coef)
+                + self._surcharge_term(water_corr_q)
+                + self._embedment_term(emb_coef, water_corr_gamma))
 
 
 class TerzaghiUBC4StripFooting(TerzaghiUltimateBearingCapacity):
-    """Ultimate bearing capacity for strip footing according to 
+    r"""Ultimate bearing capacity for strip footing according to 
     ``Terzaghi 1943``.
-    """
 
-    @round_
-    def bearing_capacity(self) -> float:
-        r"""Calculates ultimate bearing capacity for strip footing.
+    .. math:: q_u = cN_c + qN_q + 0.5 \gamma BN_{\gamma}
+    """
 
-        .. math:: q_u = cN_c + qN_q + 0.5 \gamma BN_{\gamma}
-        """
-        return (self._cohesion_term(1.0)
-                + self._surcharge_term()
-                + self._embedment_term(0.5))
+    _coefs = (1.0, 0.5)
 
 
 class TerzaghiUBC4CircularFooting(TerzaghiUltimateBearingCapacity):
-    """Ultimate bearing capacity for circular footing according to 
+    r"""Ultimate bearing capacity for circular footing according to 
     ``Terzaghi 1943``.
-    """
 
-    @round_
-    def bearing_capacity(self) -> float:
-        r"""Calculates ultimate bearing capacity for circular footing.
+    .. math:: q_u = 1.3cN_c + qN_q + 0.3 \gamma BN_{\gamma}
+    """
 
-        .. math:: q_u = 1.3cN_c + qN_q + 0.3 \gamma BN_{\gamma}
-        """
-        return (self._cohesion_term(1.3)
-                + self._surcharge_term()
-                + self._embedment_term(0.3))
+    _coefs = (1.3, 0.3)
 
 
 class TerzaghiUBC4RectangularFooting(TerzaghiUltimateBearingCapacity):
-    """Ultimate bearing capacity for rectangular footing according to 
+    r"""Ultimate bearing capacity for rectangular footing according to 
     ``Terzaghi 1943``.
-    """
 
-    @round_
-    def bearing_capacity(self) -> float:
-        r"""Calculates ultimate bearing capacity for rectangular footing.
+    .. math::
 
-        .. math::
+        q_u = \left(1 + 0.3 \dfrac{B}{L} \right) c N_c + qN_q
+              + \left(1 - 0.2 \dfrac{B}{L} \right) 0.5 B \gamma N_{\gamma}
+    """
 
-            q_u = \left(1 + 0.3 \dfrac{B}{L} \right) c N_c + qN_q
-                  + \left(1 - 0.2 \dfrac{B}{L} \right) 0.5 B \gamma N_{\gamma}
-        """
+    @property
+    def _coefs(self) -> tuple[float, float]:
         width = self.foundation_size.width
         length = self.foundation_size.length
         coh_coef = 1.0 + 0.3 * (width / length)
         emb_coef = (1.0 - 0.2 * (width / length)) / 2.0
-
-        return (self._cohesion_term(coh_coef)
-                + self._surcharge_term()
-                + self._embedment_term(emb_coef))
+        return coh_coef, emb_coef
 
 
 class TerzaghiUBC4SquareFooting(TerzaghiUBC4RectangularFooting):
     r"""Ultimate bearing capacity for square footing according to 
     ``Terzaghi 1943``.
+
+    .. math:: q_u = 1.3cN_c + qN_q + 0.4 \gamma BN_{\gamma}
     """
 
-    def bearing_capacity(self):
-        r"""Calcalates ultimate bearing capacity for square footing.
-        
-        .. math:: q_u = 1.3cN_c + qN_q + 0.4 \gamma BN_{\gamma}
-        """
-        return super().bearing_capacity()
+    _coefs = (1.3, 0.4)
@@ -1,3 +1,5 @@
+import functools
+
 from geolysis.bearing_capacity import get_footing_params
 from geolysis.bearing_capacity.ubc import UltimateBearingCapacity
 from geolysis.bearing_capacity.ubc.hansen_ubc import \
@@ -16,7 +18,6 @@ class VesicBearingCapacityFactor:
     """
 
     @classmethod
-    @round_
     def n_c(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_c`.
 
@@ -25,10 +26,9 @@ class VesicBearingCapacityFactor:
 
         .. math:: N_c = \cot(\phi) \left(N_q - 1\right)
         """
-        return HansenBearingCapacityFactor.n_c(friction_angle)
+        return cls._n_c(friction_angle)
 
     @classmethod
-    @round_
     def n_q(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_q`.
 
@@ -40,10 +40,9 @@ class VesicBearingCapacityFactor:
             N_q = \tan^2\left(45 + \frac{\phi}{2}\right) \cdot
                   e^{\pi \tan(\phi)}
         """
-        return HansenBearingCapacityFactor.n_q(friction_angle)
+        return cls._n_q(friction_angle)
 
     @classmethod
-    @round_
     def n_gamma(cls, friction_angle: float) -> float:
         r"""Bearing capacity factor :math:`N_{\gamma}`.
 
@@ -52,7 +51,19 @@ class VesicBearingCapacityFactor:
 
         .. math:: N_{\gamma} = 2(N_q + 1) \tan(\phi)
         """
-        return 2.0 * (cls.n_q(friction_angle) + 1.0) * tan(friction_angle)
+        return cls._n_gamma(friction_angle)
+
+    # N_c and N_q are shared with Hansen and memoized there. The values are
+    # unrounded. Only the bearing capacity itself is rounded.
+
+    _n_c = staticmethod(HansenBearingCapacityFactor._n_c)
+    _n_q = staticmethod(HansenBearingCapacityFactor._n_q)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _n_gamma(friction_angle: float) -> float:
+        n_q = VesicBearingCapacityFactor._n_q(friction_angle)
+        return 2.0 * (n_q + 1.0) * tan(friction_angle)
 
 
 class VesicShapeFactor:
@@ -61,7 +72,6 @@ class VesicShapeFactor:
     """
 
     @classmethod
-    @round_
     def s_c(cls, friction_angle: float,
             foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_c`.
@@ -86,12 +96,12 @@ class VesicShapeFactor:
         """
         width, length, shape = get_footing_params(foundation_size)
 
-        n_q = VesicBearingCapacityFactor.n_q(friction_angle)
-        n_c = VesicBearingCapacityFactor.n_c(friction_angle)
+        n_q = VesicBearingCapacityFactor._n_q(friction_angle)
+        n_c = VesicBearingCapacityFactor._n_c(friction_angle)
 
-        if shape == Shape.STRIP:
+        if shape is Shape.STRIP:
             shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
+        elif shape is Shape.RECTANGLE:
             shape_factor = 1.0 + (width / length) * (n_q / n_c)
         elif shape in (Shape.SQUARE, Shape.CIRCLE):
             shape_factor = 1.0 + (n_q / n_c)
@@ -101,7 +111,6 @@ class VesicShapeFactor:
         return shape_factor
 
     @classmethod
-    @round_
     def s_q(cls, friction_angle: float,
             foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_q`.
@@ -126,9 +135,9 @@ class VesicShapeFactor:
         """
         width, length, shape = get_footing_params(foundation_size)
 
-        if shape == Shape.STRIP:
+        if shape is Shape.STRIP:
             shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
+        elif shape is Shape.RECTANGLE:
             shape_factor = 1.0 + (width / length) * tan(friction_angle)
         elif shape in (Shape.SQUARE, Shape.CIRCLE):
             shape_factor = 1.0 + tan(friction_angle)
@@ -138,7 +147,6 @@ class VesicShapeFactor:
         return shape_factor
 
     @classmethod
-    @round_
     def s_gamma(cls, foundation_size: FoundationSize) -> float:
         r"""Shape factor :math:`S_{\gamma}`.
 
@@ -158,9 +166,9 @@ class VesicShapeFactor:
         """
         width, length, shape = get_footing_params(foundation_size)
 
-        if shape == Shape.STRIP:
+        if shape is Shape.STRIP:
             shape_factor = 1.0
-        elif shape == Shape.RECTANGLE:
+        elif shape is Shape.RECTANGLE:
             shape_factor = 1.0 - 0.4 * (width / length)
         elif shape in (Shape.SQUARE, Shape.CIRCLE):
             shape_factor = 0.6
@@ -176,7 +184,6 @@ class VesicDepthFactor:
     """
 
     @classmethod
-    @round_
     def d_c(cls, foundation_size: FoundationSize) -> float:
         r"""Depth factor :math:`D_c`.
 
@@ -191,7 +198,6 @@ class VesicDepthFactor:
         return 1.0 + 0.4 * depth / width
 
     @classmethod
-    @round_
     def d_q(cls, friction_angle: float,
             foundation_size: FoundationSize) -> float:
         r"""Depth factor :math:`D_q`.
@@ -210,12 +216,12 @@ class VesicDepthFactor:
         depth = foundation_size.depth
         width = foundation_size.width
 
+        one_minus_sin = 1.0 - sin(friction_angle)
         return (1.0 + 2.0 * tan(friction_angle)
-                * (1.0 - sin(friction_angle)) ** 2.0
+                * one_minus_sin * one_minus_sin
                 * (depth / width))
 
     @classmethod
-    @round_
     def d_gamma(cls) -> float:
         r"""Depth factor :math:`D_{\gamma}`.
 
@@ -230,7 +236,6 @@ class VesicInclinationFactor:
     """
 
     @classmethod
-    @round_
     def i_c(cls, load_angle: float) -> float:
         r"""Inclination factor :math:`I_c`.
 
@@ -240,10 +245,10 @@ class VesicInclinationFactor:
 
         .. math:: i_c = (1 - \dfrac{\alpha}{90})^2
         """
-        return (1.0 - load_angle / 90.0) ** 2.0
+        ratio = 1.0 - load_angle / 90.0
+        return ratio * ratio
 
     @classmethod
-    @round_
     def i_q(cls, load_angle: float) -> float:
         r"""Inclination factor :math:`I_q`.
 
@@ -256,7 +261,6 @@ class VesicInclinationFactor:
         return cls.i_c(load_angle=load_angle)
 
     @classmethod
-    @round_
     def i_gamma(cls, friction_angle: float, load_angle: float) -> float:
         r"""Inclination factor :math:`I_{\gamma}`.
 
@@ -271,23 +275,24 @@ class VesicInclinationFactor:
         """
         if isclose(friction_angle, 0.0):
             return 1.0
-        return (1.0 - load_angle / friction_angle) ** 2.0
+        ratio = 1.0 - load_angle / friction_angle
+        return ratio * ratio
 
 
 class VesicUltimateBearingCapacity(UltimateBearingCapacity):
     """Ultimate bearing capacity for soils according to ``Vesic (1973)``."""
 
-    @property
+    @functools.cached_property
     def n_c(self) -> float:
-        return VesicBearingCapacityFactor.n_c(self.friction_angle)
+        return VesicBearingCapacityFactor._n_c(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_q(self) -> float:
-        return VesicBearingCapacityFactor.n_q(self.friction_angle)
+        return VesicBearingCapacityFactor._n_q(self.friction_angle)
 
-    @property
+    @functools.cached_property
     def n_gamma(self) -> float:
-        return VesicBearingCapacityFactor.n_gamma(self.friction_angle)
+        return VesicBearingCapacityFactor._n_gamma(self.friction_angle)
 
     @property
     def s_c(self) -> float:
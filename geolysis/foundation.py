@@ -1,6 +1,6 @@
 import enum
 from abc import abstractmethod
-from typing import Optional, Protocol, TypeVar
+from typing import Optional, Protocol
 
 from geolysis import validators
 from geolysis.utils import inf
@@ -8,34 +8,6 @@ from geolysis.utils import inf
 __all__ = ["create_foundation", "FoundationSize", "Shape", "StripFooting",
            "CircularFooting", "SquareFooting", "RectangularFooting"]
 
-T = TypeVar("T")
-
-
-class _Field:
-    """A field that references another field."""
-
-    def __init__(self, *, ref_attr: str, ref_obj: Optional[str] = None,
-                 doc: Optional[str] = None):
-        self.ref_attr = ref_attr
-        self.ref_obj = ref_obj
-        self.__doc__ = doc
-
-    def __get__(self, obj, objtype=None) -> T:
-        if self.ref_obj is not None:
-            ref_obj = getattr(obj, self.ref_obj)
-            return getattr(ref_obj, self.ref_attr)
-        return getattr(obj, self.ref_attr)
-
-    def __set__(self, obj, value) -> None:
-        if self.ref_obj is not None:
-            ref_obj = getattr(obj, self.ref_obj)
-            setattr(ref_obj, self.ref_attr, value)
-        else:
-            setattr(obj, self.ref_attr, value)
-
-    def __set_name__(self, objtype, property_name) -> None:
-        self.property_name = property_name
-
 
 class Shape(enum.StrEnum):
     """Enumeration of foundation shapes."""
@@ -62,6 +34,8 @@ class FootingSize(Protocol):
 class StripFooting:
     """A class representation of strip footing."""
 
+    __slots__ = ("_width", "_length", "_shape")
+
     def __init__(self, width: float, length: float = inf) -> None:
         """
         :param width: Width of foundation footing. (m)
@@ -107,12 +81,7 @@ class CircularFooting:
         square and rectangular footing follow.
     """
 
-    _doc = "Refers to the diameter of the circular footing."
-
-    width = _Field(ref_attr="diameter", doc=_doc)
-    length = _Field(ref_attr="diameter", doc=_doc)
-
-    del _doc
+    __slots__ = ("_diameter", "_shape")
 
     def __init__(self, diameter: float):
         """
@@ -130,6 +99,24 @@ class CircularFooting:
     def diameter(self, val):
         self._diameter = val
 
+    @property
+    def width(self) -> float:
+        """Refers to the diameter of the circular footing."""
+        return self.diameter
+
+    @width.setter
+    def width(self, val: float):
+        self.diameter = val
+
+    @property
+    def length(self) -> float:
+        """Refers to the diameter of the circular footing."""
+        return self.diameter
+
+    @length.setter
+    def length(self, val: float):
+        self.diameter = val
+
     @property
     def shape(self) -> Shape:
         return self._shape
@@ -138,8 +125,7 @@ class CircularFooting:
 class SquareFooting:
     """A class representation of square footing."""
 
-    length = _Field(ref_attr="width",
-                    doc="Refers to the width of the square footing.")
+    __slots__ = ("_width", "_shape")
 
     def __init__(self, width: float):
         """
@@ -157,6 +143,15 @@ class SquareFooting:
     def width(self, val):
         self._width = val
 
+    @property
+    def length(self) -> float:
+        """Refers to the width of the square footing."""
+        return self.width
+
+    @length.setter
+    def length(self, val: float):
+        self.width = val
+
     @property
     def shape(self):
         return self._shape
@@ -165,6 +160,8 @@ class SquareFooting:
 class RectangularFooting:
     """A class representation of rectangular footing."""
 
+    __slots__ = ("_width", "_length", "_shape")
+
     def __init__(self, width: float, length: float):
         """
         :param width: Width of foundation footing. (m)
@@ -203,12 +200,8 @@ class RectangularFooting:
 class FoundationSize:
     """A simple class representing a foundation structure."""
 
-    width = _Field(ref_attr="width", ref_obj="footing_size",
-                   doc="Refers to the width of foundation footing.")
-    length = _Field(ref_attr="length", ref_obj="footing_size",
-                    doc="Refers to the length of foundation footing.")
-    footing_shape = _Field(ref_attr="shape", ref_obj="footing_size",
-                           doc="Refers to the shape of foundation footing.")
+    __slots__ = ("_depth", "footing_size", "_eccentricity",
+                 "_ground_water_level")
 
     def __init__(self, depth: float, footing_size: FootingSize,
                  eccentricity: float = 0.0,
@@ -263,6 +256,29 @@ class FoundationSize:
     def ground_water_level(self, val: float) -> None:
         self._ground_water_level = val
 
+    @property
+    def width(self) -> float:
+        """Refers to the width of foundation footing."""
+        return self.footing_size.width
+
+    @width.setter
+    def width(self, val: float):
+        self.footing_size.width = val
+
+    @property
+    def length(self) -> float:
+        """Refers to the length of foundation footing."""
+        return self.footing_size.length
+
+    @length.setter
+    def length(self, val: float):
+        self.footing_size.length = val
+
+    @property
+    def footing_shape(self) -> Shape:
+        """Refers to the shape of foundation footing."""
+        return self.footing_size.shape
+
     @property
     def effective_width(self) -> float:
         """Returns the effective width of the foundation footing."""
@@ -20,27 +20,27 @@ def rad2deg(x: float, /) -> float:
 
 def tan(x: float, /) -> float:
     """Return the tangent of x (measured in degrees)."""
-    return math.tan(deg2rad(x))
+    return math.tan(math.radians(x))
 
 
 def cot(x: float, /) -> float:
     """Return the cotangent of x (measured in degrees)."""
-    return 1 / tan(x)
+    return 1 / math.tan(math.radians(x))
 
 
 def sin(x: float, /) -> float:
     """Return the sine of x (measured in degrees)."""
-    return math.sin(deg2rad(x))
+    return math.sin(math.radians(x))
 
 
 def cos(x: float, /) -> float:
     """Return the cosine of x (measured in degrees)."""
-    return math.cos(deg2rad(x))
+    return math.cos(math.radians(x))
 
 
 def arctan(x: float, /) -> float:
     """Return the arc tangent (measured in degrees) of x."""
-    return rad2deg(math.atan(x))
+    return math.degrees(math.atan(x))
 
 
 def round_(ndigits: int | Callable[..., SupportsRound]) -> Callable:
@@ -56,13 +56,12 @@ def round_(ndigits: int | Callable[..., SupportsRound]) -> Callable:
     """
 
     default_dp = 2
+    dp = ndigits if not callable(ndigits) else default_dp
 
     def dec(fn) -> Callable[..., float]:
         @functools.wraps(fn)
         def wrapper(*args, **kwargs) -> float:
-            dp = ndigits if not callable(ndigits) else default_dp
-            res = fn(*args, **kwargs)
-            return round(res, ndigits=dp)
+            return round(fn(*args, **kwargs), dp)
 
         return wrapper
 
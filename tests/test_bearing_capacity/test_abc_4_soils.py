@@ -3,6 +3,7 @@ import pytest
 from geolysis.bearing_capacity.abc.cohl import (
     BowlesABC4MatFoundation, BowlesABC4PadFoundation,
     MeyerhofABC4MatFoundation, TerzaghiABC4MatFoundation,
+    TerzaghiABC4PadFoundation,
     create_allowable_bearing_capacity, create_foundation)
 from geolysis.foundation import create_foundation
 
@@ -77,7 +78,27 @@ class TestTerzaghiABC(SetUp):
         assert terzaghi.bearing_capacity() == pytest.approx(expected=expected,
                                                             rel=0.01)
 
+    def test_terzaghi_abc_after_foundation_size_change(self):
+        fs = create_foundation(depth=1.5, width=1.2, shape="square")
+        terzaghi = TerzaghiABC4PadFoundation(corrected_spt_n_value=17.0,
+                                             tol_settlement=20.0,
+                                             foundation_size=fs)
+        terzaghi.bearing_capacity()
+
+        fs.depth = 3.0
+        fs.ground_water_level = 0.5
+        assert terzaghi.bearing_capacity() == pytest.approx(expected=171.34,
+                                                            rel=0.01)
+
     # def test_terzaghi_abc_4_mat_foundation(self):
     #     terzaghi = TerzaghiABC4MatFoundation(**self.kwargs)
     #     assert terzaghi.bearing_capacity() == pytest.approx(expected=43.98,
     #                                                         rel=0.01)
+
+
+class TestCreateABC:
+    def test_unknown_foundation_type(self):
+        with pytest.raises(ValueError, match="raft"):
+            create_allowable_bearing_capacity(12.0, 20.0, depth=1.5,
+                                              width=1.2,
+                                              foundation_type="raft")
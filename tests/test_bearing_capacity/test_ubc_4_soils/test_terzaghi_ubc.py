@@ -1,3 +1,4 @@
+import functools
 import unittest
 
 import pytest
@@ -11,6 +12,10 @@ from geolysis.bearing_capacity.ubc import (TerzaghiBearingCapacityFactor,
 from geolysis.foundation import create_foundation
 from geolysis.utils import inf
 
+ERROR_TOL = 0.01
+
+approx = functools.partial(pytest.approx, rel=ERROR_TOL)
+
 
 class TestTerzaghiBCF:
     @pytest.mark.parametrize("f_angle, expected",
@@ -20,7 +25,7 @@ class TestTerzaghiBCF:
                               (35.0, 57.8)])
     def test_n_c(self, f_angle, expected):
         nc = TerzaghiBearingCapacityFactor.n_c(f_angle)
-        assert nc == pytest.approx(expected, 0.01)
+        assert nc == approx(expected)
 
     @pytest.mark.parametrize("f_angle, expected",
                              [(0.0, 1.00),
@@ -29,7 +34,7 @@ class TestTerzaghiBCF:
                               (35.0, 41.44)])
     def test_n_q(self, f_angle, expected):
         nq = TerzaghiBearingCapacityFactor.n_q(f_angle)
-        assert nq == pytest.approx(expected, 0.01)
+        assert nq == approx(expected)
 
     @pytest.mark.parametrize("f_angle, expected",
                              [(0.0, 0.00),
@@ -38,7 +43,21 @@ class TestTerzaghiBCF:
                               (35.0, 46.52)])
     def test_n_gamma(self, f_angle, expected):
         ngamma = TerzaghiBearingCapacityFactor.n_gamma(f_angle)
-        assert ngamma == pytest.approx(expected, 0.01)
+        assert ngamma == approx(expected)
+
+    @pytest.mark.parametrize("f_angle, expected",
+                             [(0.0, (5.70, 1.00, 0.00)),
+                              (35.0, (57.8, 41.44, 46.52))])
+    def test_factors(self, f_angle, expected):
+        factors = TerzaghiBearingCapacityFactor.factors(f_angle)
+        assert factors == approx(expected)
+
+    def test_factors_are_memoized(self):
+        cache_info = TerzaghiBearingCapacityFactor._raw_factors.cache_info
+        TerzaghiBearingCapacityFactor.n_q(25.0)
+        hits = cache_info().hits
+        TerzaghiBearingCapacityFactor.n_q(25.0)
+        assert cache_info().hits == hits + 1
 
 
 class TestTerzaghiUBC4StripFooting:
@@ -60,47 +79,50 @@ class TestTerzaghiUBC4StripFooting:
                                                ubc_type="TERZAGHI")
 
         actual = ubc.bearing_capacity()
-        assert actual == pytest.approx(expected, 0.01)
+        assert actual == approx(expected)
 
 
 class TestTerzaghiUBC4SquareFooting(unittest.TestCase):
-    def setUp(self):
-        self.fs = create_foundation(depth=1.0, width=2.0, shape="square")
-        self.soil_prop = dict(friction_angle=25.0, cohesion=15.0,
-                              moist_unit_wgt=18.0)
+    @classmethod
+    def setUpClass(cls):
+        cls.fs = create_foundation(depth=1.0, width=2.0, shape="square")
+        cls.soil_prop = dict(friction_angle=25.0, cohesion=15.0,
+                             moist_unit_wgt=18.0)
 
     def test_bearing_capacity(self):
         ubc = TerzaghiUBC4SquareFooting(**self.soil_prop,
                                         foundation_size=self.fs,
                                         apply_local_shear=True)
         actual = ubc.bearing_capacity()
-        assert actual == pytest.approx(323.008, 0.01)
+        assert actual == approx(323.008)
 
 
 class TestTerzaghiUBC4CircFooting(unittest.TestCase):
-    def setUp(self):
-        self.fs = create_foundation(depth=1.0, width=2.3, shape="circle")
-        self.soil_prop = dict({"friction_angle": 25.0, "cohesion": 15.0,
-                               "moist_unit_wgt": 18.0})
+    @classmethod
+    def setUpClass(cls):
+        cls.fs = create_foundation(depth=1.0, width=2.3, shape="circle")
+        cls.soil_prop = dict({"friction_angle": 25.0, "cohesion": 15.0,
+                              "moist_unit_wgt": 18.0})
 
     def test_bearing_capacity(self):
         ubc = TerzaghiUBC4CircularFooting(**self.soil_prop,
                                           foundation_size=self.fs,
                                           apply_local_shear=True)
         actual = ubc.bearing_capacity()
-        assert actual == pytest.approx(318.9094, 0.01)
+        assert actual == approx(318.9094)
 
 
 class TestTerzaghiUBC4RectFooting(unittest.TestCase):
-    def setUp(self):
-        self.fs = create_foundation(depth=1.0, width=1.5, length=2.5,
-                                    shape="rectangle")
-        self.soil_prop = dict(friction_angle=25.0, cohesion=15.0,
-                              moist_unit_wgt=18.0)
+    @classmethod
+    def setUpClass(cls):
+        cls.fs = create_foundation(depth=1.0, width=1.5, length=2.5,
+                                   shape="rectangle")
+        cls.soil_prop = dict(friction_angle=25.0, cohesion=15.0,
+                             moist_unit_wgt=18.0)
 
     def test_bearing_capacity(self):
         ubc = TerzaghiUBC4RectangularFooting(**self.soil_prop,
                                              foundation_size=self.fs,
                                              apply_local_shear=True)
         actual = ubc.bearing_capacity()
-        assert actual == pytest.approx(300.0316, 0.01)
+        assert actual == approx(300.0316)
@@ -0,0 +1,53 @@
+import pytest
+
+from geolysis.bearing_capacity.ubc import create_ultimate_bearing_capacity
+
+
+class TestUltimateBearingCapacity:
+    @pytest.mark.parametrize("ubc_type", ["HANSEN", "TERZAGHI", "VESIC"])
+    def test_bearing_capacity_after_shear_parameters_change(self, ubc_type):
+        kwargs = dict(cohesion=20.0, moist_unit_wgt=18.0, depth=1.5,
+                      width=2.0, shape="square", ubc_type=ubc_type)
+        ubc = create_ultimate_bearing_capacity(friction_angle=20.0, **kwargs)
+        ubc.bearing_capacity()
+
+        ubc.friction_angle = 30.0
+        expected = create_ultimate_bearing_capacity(friction_angle=30.0,
+                                                    **kwargs)
+        assert ubc.bearing_capacity() == expected.bearing_capacity()
+
+        ubc.apply_local_shear = True
+        expected = create_ultimate_bearing_capacity(friction_angle=30.0,
+                                                    apply_local_shear=True,
+                                                    **kwargs)
+        assert ubc.bearing_capacity() == expected.bearing_capacity()
+
+    @pytest.mark.parametrize("ubc_type, expected", [("HANSEN", 729.37),
+                                                    ("TERZAGHI", 651.96),
+                                                    ("VESIC", 823.70)])
+    def test_bearing_capacity_after_ground_water_level_change(self, ubc_type,
+                                                              expected):
+        ubc = create_ultimate_bearing_capacity(friction_angle=20.0,
+                                               cohesion=20.0,
+                                               moist_unit_wgt=18.0, depth=1.5,
+                                               width=2.0, shape="square",
+                                               ubc_type=ubc_type)
+        ubc.bearing_capacity()
+
+        ubc.foundation_size.ground_water_level = 1.0
+        actual = ubc.bearing_capacity()
+        assert actual == pytest.approx(expected, 0.01)
+
+    @pytest.mark.parametrize("ubc_type", ["HANSEN", "TERZAGHI", "VESIC"])
+    def test_bearing_capacity_after_foundation_size_change(self, ubc_type):
+        kwargs = dict(friction_angle=20.0, cohesion=20.0, moist_unit_wgt=18.0,
+                      shape="rectangle", ubc_type=ubc_type)
+        ubc = create_ultimate_bearing_capacity(depth=1.5, width=2.0,
+                                               length=3.0, **kwargs)
+        ubc.bearing_capacity()
+
+        ubc.foundation_size.depth = 2.0
+        ubc.foundation_size.width = 2.5
+        expected = create_ultimate_bearing_capacity(depth=2.0, width=2.5,
+                                                    length=3.0, **kwargs)
+        assert ubc.bearing_capacity() == expected.bearing_capacity()